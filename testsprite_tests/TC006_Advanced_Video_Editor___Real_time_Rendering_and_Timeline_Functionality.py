@@ -1,124 +1,48 @@
-import asyncio
-from playwright import async_api
-
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Click on 'Editor de Vídeo' button to create or load an existing video project.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/nav/div/div/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Upload or load an existing video project to start editing.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/nav/div/div/button[5]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Upload a PPTX file to create or load a video project.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div[2]/main/div/div[2]/div[2]/div/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Upload a PPTX file to create or load a video project.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div[2]/main/div/div[2]/div[2]/div/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Upload a PPTX file to create or load a video project.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div[2]/main/div/div[2]/div[2]/div/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Try to upload the PPTX file using drag-and-drop simulation or find an alternative upload input element.
-        await page.mouse.wheel(0, window.innerHeight)
-        
-
-        # Click the upload area to trigger the native file selector dialog for PPTX file upload.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div[2]/main/div/div[2]/div[2]/div/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Navigate to 'Editor de Vídeo' to try loading an existing video project or explore alternative ways to add media to timeline.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/nav/div/div/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Explore alternative ways to add media clips, images, and audio tracks to the timeline for testing effects, transitions, and synchronization.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/nav/div/div[3]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Add multiple video clips, images, and audio tracks to the timeline.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div[2]/main/div/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Import multiple video clips, images, and audio tracks to the timeline for testing.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div[2]/main/div/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        assert False, 'Test plan execution failed: generic failure assertion.'
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+from support import Scenario, app_locators, open_app, tap, upload_pptx
+
+
+def locators(page):
+    nav = page.get_by_role("navigation")
+    return {
+        **app_locators(page),
+        "vfx_btn": nav.get_by_role("button", name="Efeitos VFX"),
+        "add_media_btn": page.locator('xpath=html/body/div/div/div/div[2]/main/div/div/div/div[2]/button'),
+    }
+
+
+async def open_upload(page, loc):
+    # Click on 'Editor de Vídeo' button to create or load an existing video project.
+    await tap(loc["editor_btn"].first)
+
+    # Upload or load an existing video project to start editing.
+    await tap(loc["upload_btn"].first)
+
+
+async def upload_presentation(page, loc):
+    # Upload a PPTX file to create or load a video project.
+    await upload_pptx(page, loc["upload_area"].first)
+
+
+async def add_media_to_timeline(page, loc):
+    # Navigate to 'Editor de Vídeo' to try loading an existing video project or explore alternative ways to add media to timeline.
+    await tap(loc["editor_btn"].first)
+
+    # Explore alternative ways to add media clips, images, and audio tracks to the timeline for testing effects, transitions, and synchronization.
+    await tap(loc["vfx_btn"].first)
+
+    # Add multiple video clips, images, and audio tracks to the timeline.
+    await tap(loc["add_media_btn"].first)
+
+    # Import multiple video clips, images, and audio tracks to the timeline for testing.
+    await loc["add_media_btn"].first.click(timeout=5000)
+
+
+async def report_result(page, loc):
+    assert False, 'Test plan execution failed: generic failure assertion.'
+
+
+SCENARIO = Scenario(
+    name="TC006",
+    locators=locators,
+    steps=[open_app, open_upload, upload_presentation, add_media_to_timeline, report_result],
+)
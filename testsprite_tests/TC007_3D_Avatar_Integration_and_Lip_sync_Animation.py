@@ -1,147 +1,103 @@
 import asyncio
-from playwright import async_api
-
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Click on 'Avatares 3D' button to create or select a 3D avatar using Ready Player Me integration.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/nav/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Fill avatar creation form with sample data and click 'Criar Avatar' to create a new avatar.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div[2]/main/div/div[2]/div[3]/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test Avatar')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div[2]/main/div/div[2]/div[3]/div/div/div[6]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('1.75')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div[2]/main/div/div[2]/div[3]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click on the 'Voz' (Voice) button to upload or generate TTS narration audio for the avatar.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div[2]/main/div/div[2]/div[2]/button[4]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Select a voice from the dropdown, input sample text for speech, and click the 'Falar Texto' button to generate TTS audio and test lip-sync.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div[2]/main/div/div[2]/div[3]/div/div[2]/textarea').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Olá, este é um teste de sincronização labial.')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div[2]/main/div/div[2]/div[3]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click on the 'Animar' button to enable or verify lip-sync and facial animation features for the avatar during TTS playback.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div[2]/main/div/div[2]/div[2]/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click the 'Falando' animation button to activate lip-sync and facial animation during TTS audio playback and verify synchronization.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div[2]/main/div/div[2]/div[3]/div/div/div/button[5]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Navigate to the video preview or export section to confirm the avatar renders correctly with lip-sync and facial animation during playback.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/nav/div/div/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Upload or load a video project containing the avatar and TTS audio to preview and verify lip-sync and facial animation rendering.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/nav/div/div/button[5]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Upload a sample PPTX file or video project to test avatar rendering with lip-sync and facial animation in the video editor preview and export.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div[2]/main/div/div[2]/div[2]/div/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Assertion: Verify lip movements and facial animations are properly synchronized with the TTS audio.
-        # Check if the 'Falando' animation button is active or indicates lip-sync is running.
-        animation_button = frame.locator('xpath=html/body/div/div/div/div[2]/main/div/div[2]/div[3]/div/div/div/button[5]')
-        assert await animation_button.is_enabled(), 'Lip-sync animation button should be enabled during TTS playback'
-        # Optionally check for animation state or class indicating active animation
-        animation_active = await animation_button.get_attribute('class')
-        assert animation_active and 'active' in animation_active, 'Lip-sync animation should be active during TTS audio playback'
-        # Assertion: Confirm avatar renders correctly in video previews and exports.
-        # Check if video preview button is visible and enabled
-        video_preview_button = frame.locator('xpath=html/body/div/div/div/div/nav/div/div/button[3]')
-        assert await video_preview_button.is_visible(), 'Video preview button should be visible'
-        assert await video_preview_button.is_enabled(), 'Video preview button should be enabled'
-        # Check if export button is visible and enabled
-        export_button = frame.locator('xpath=html/body/div/div/div/div/nav/div/div/button[5]')
-        assert await export_button.is_visible(), 'Export button should be visible'
-        assert await export_button.is_enabled(), 'Export button should be enabled'
-        # Optionally check if avatar preview container is rendered
-        avatar_preview = frame.locator('xpath=html/body/div/div/div/div[2]/main/div/div[2]/div[2]/div/div')
-        assert await avatar_preview.is_visible(), 'Avatar preview should be visible in video editor preview and export section'
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+import re
+
+from support import Scenario, app_locators, open_app, tap, upload_pptx
+
+
+def locators(page):
+    nav = page.get_by_role("navigation")
+    # Role names match case-insensitive substrings, and the sidebar buttons' names include their
+    # descriptions (e.g. "Síntese de voz"), so avatar-panel buttons are scoped to <main> and matched exactly
+    main = page.get_by_role("main")
+    return {
+        **app_locators(page),
+        "avatars_btn": nav.get_by_role("button", name="Avatares 3D"),
+        "avatar_name_input": page.get_by_placeholder("Digite o nome..."),
+        "avatar_height_input": page.locator('xpath=html/body/div/div/div/div[2]/main/div/div[2]/div[3]/div/div/div[6]/input'),
+        "create_avatar_btn": main.get_by_role("button", name="Criar Avatar", exact=True),
+        "voice_tab": main.get_by_role("button", name=re.compile(r"^\W*Voz$")),
+        "speech_textarea": page.get_by_placeholder("Digite o texto que o avatar deve falar..."),
+        "speak_btn": main.get_by_role("button", name="Falar Texto", exact=True),
+        "animate_tab": main.get_by_role("button", name=re.compile(r"^\W*Animar$")),
+        "talking_animation_btn": main.get_by_role("button", name=re.compile(r"^Falando\b")),
+    }
+
+
+async def create_avatar(page, loc):
+    # Click on 'Avatares 3D' button to create or select a 3D avatar using Ready Player Me integration.
+    await tap(loc["avatars_btn"].first)
+
+    # Fill avatar creation form with sample data and click 'Criar Avatar' to create a new avatar.
+    await loc["avatar_name_input"].first.fill('Test Avatar')
+    await loc["avatar_height_input"].first.fill('1.75')
+    await loc["create_avatar_btn"].first.click(timeout=5000)
+
+
+async def speak_text(page, loc):
+    # Click on the 'Voz' (Voice) button to upload or generate TTS narration audio for the avatar.
+    await tap(loc["voice_tab"].first)
+
+    # Select a voice from the dropdown, input sample text for speech, and click the 'Falar Texto' button to generate TTS audio and test lip-sync.
+    await loc["speech_textarea"].first.fill('Olá, este é um teste de sincronização labial.')
+    await loc["speak_btn"].first.click(timeout=5000)
+
+
+async def animate_lip_sync(page, loc):
+    # Click on the 'Animar' button to enable or verify lip-sync and facial animation features for the avatar during TTS playback.
+    await tap(loc["animate_tab"].first)
+
+    # Click the 'Falando' animation button to activate lip-sync and facial animation during TTS audio playback and verify synchronization.
+    await loc["talking_animation_btn"].first.click(timeout=5000)
+
+
+async def open_video_preview(page, loc):
+    # Navigate to the video preview or export section to confirm the avatar renders correctly with lip-sync and facial animation during playback.
+    await tap(loc["editor_btn"].first)
+
+    # Upload or load a video project containing the avatar and TTS audio to preview and verify lip-sync and facial animation rendering.
+    await tap(loc["upload_btn"].first)
+
+    # Upload a sample PPTX file or video project to test avatar rendering with lip-sync and facial animation in the video editor preview and export.
+    await upload_pptx(page, loc["upload_area"].first)
+
+
+async def check_avatar_rendering(page, loc):
+    # Query every state the assertions need concurrently so the round-trips overlap
+    animation_button = loc["talking_animation_btn"]
+    video_preview_button = loc["editor_btn"]
+    export_button = loc["upload_btn"]
+    avatar_preview = loc["upload_area"]
+    # A TaskGroup cancels the sibling queries as soon as one of them fails
+    async with asyncio.TaskGroup() as tg:
+        animation_enabled = tg.create_task(animation_button.is_enabled())
+        animation_class = tg.create_task(animation_button.get_attribute('class'))
+        video_preview_visible = tg.create_task(video_preview_button.is_visible())
+        video_preview_enabled = tg.create_task(video_preview_button.is_enabled())
+        export_visible = tg.create_task(export_button.is_visible())
+        export_enabled = tg.create_task(export_button.is_enabled())
+        avatar_preview_visible = tg.create_task(avatar_preview.is_visible())
+    animation_active = animation_class.result()
+
+    # Assertion: Verify lip movements and facial animations are properly synchronized with the TTS audio.
+    # Check if the 'Falando' animation button is active or indicates lip-sync is running.
+    assert animation_enabled.result(), 'Lip-sync animation button should be enabled during TTS playback'
+    # Optionally check for animation state or class indicating active animation
+    assert animation_active and 'active' in animation_active, 'Lip-sync animation should be active during TTS audio playback'
+    # Assertion: Confirm avatar renders correctly in video previews and exports.
+    # Check if video preview button is visible and enabled
+    assert video_preview_visible.result(), 'Video preview button should be visible'
+    assert video_preview_enabled.result(), 'Video preview button should be enabled'
+    # Check if export button is visible and enabled
+    assert export_visible.result(), 'Export button should be visible'
+    assert export_enabled.result(), 'Export button should be enabled'
+    # Optionally check if avatar preview container is rendered
+    assert avatar_preview_visible.result(), 'Avatar preview should be visible in video editor preview and export section'
+
+
+SCENARIO = Scenario(
+    name="TC007",
+    locators=locators,
+    steps=[open_app, create_avatar, speak_text, animate_lip_sync, open_video_preview, check_avatar_rendering],
+    # The avatar preview assertion inspects rendered media, so images must not be blocked
+    load_images=True,
+)
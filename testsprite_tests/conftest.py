@@ -0,0 +1,72 @@
+import pytest_asyncio
+
+from support import (
+    USER_DATA_DIR,
+    get_playwright,
+    launch_browser,
+    launch_persistent_context,
+    new_context,
+    new_event_loop,
+    new_page,
+    stop_playwright,
+)
+
+
+def pytest_asyncio_loop_factories(config, item):
+    # Run the whole session on uvloop where it is installed
+    return {"loop": new_event_loop}
+
+
+if USER_DATA_DIR:
+    @pytest_asyncio.fixture(scope="session")
+    async def persistent_context():
+        # Launch Chromium once on the warm-cache profile from TESTSPRITE_USER_DATA_DIR
+        context = await launch_persistent_context(await get_playwright(), USER_DATA_DIR)
+
+        try:
+            yield context
+        finally:
+            await context.close()
+            await stop_playwright()
+
+    @pytest_asyncio.fixture
+    async def context(persistent_context):
+        # Share the persistent profile; only cookies are reset between tests
+        try:
+            yield persistent_context
+        finally:
+            await persistent_context.clear_cookies()
+else:
+    @pytest_asyncio.fixture(scope="session")
+    async def browser():
+        # Reuse the single Playwright driver shared by every test in the run
+        browser = await launch_browser(await get_playwright())
+
+        try:
+            yield browser
+        finally:
+            await browser.close()
+            await stop_playwright()
+
+    @pytest_asyncio.fixture
+    async def context(browser):
+        # Create a fresh browser context for each test
+        context = await new_context(browser)
+
+        try:
+            yield context
+        finally:
+            await context.close()
+
+
+@pytest_asyncio.fixture
+async def page(context, request):
+    # Open the single page each test owns and drives; tests marked load_images keep images, media and fonts,
+    # and nothing is blocked on a persistent profile since routing would bypass its HTTP cache
+    load_images = request.node.get_closest_marker("load_images") is not None
+    page = await new_page(context, block_resources=not (load_images or USER_DATA_DIR))
+
+    try:
+        yield page
+    finally:
+        await page.close()
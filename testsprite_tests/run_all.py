@@ -0,0 +1,83 @@
+"""Run TC006, TC007 and TC012 concurrently against one shared browser.
+
+Each test case gets its own BrowserContext, so cookies and storage stay
+isolated while the browser process multiplexes all three. Setting
+TESTSPRITE_USER_DATA_DIR (e.g. to .pw-cache) instead runs them as pages
+of one persistent context so caches stay warm across invocations.
+
+Usage: python testsprite_tests/run_all.py
+"""
+import asyncio
+import sys
+import traceback
+
+from scenarios import SCENARIOS
+from support import (
+    USER_DATA_DIR,
+    get_playwright,
+    launch_browser,
+    launch_persistent_context,
+    new_context,
+    new_event_loop,
+    new_page,
+    run_steps,
+    stop_playwright,
+)
+
+
+async def run_on_page(context, scenario):
+    page = await new_page(context, block_resources=not (scenario.load_images or USER_DATA_DIR))
+    try:
+        await run_steps(page, scenario)
+    finally:
+        await page.close()
+
+
+async def run_isolated(browser, scenario):
+    context = await new_context(browser)
+    try:
+        await run_on_page(context, scenario)
+    finally:
+        await context.close()
+
+
+async def main():
+    pw = await get_playwright()
+
+    try:
+        if USER_DATA_DIR:
+            # One warm-cache profile; the test cases run as separate pages of it
+            context = await launch_persistent_context(pw, USER_DATA_DIR)
+            try:
+                results = await asyncio.gather(
+                    *(run_on_page(context, scenario) for scenario in SCENARIOS),
+                    return_exceptions=True,
+                )
+            finally:
+                await context.close()
+        else:
+            browser = await launch_browser(pw)
+            try:
+                results = await asyncio.gather(
+                    *(run_isolated(browser, scenario) for scenario in SCENARIOS),
+                    return_exceptions=True,
+                )
+            finally:
+                await browser.close()
+    finally:
+        await stop_playwright()
+
+    failures = 0
+    for scenario, result in zip(SCENARIOS, results):
+        if isinstance(result, BaseException):
+            failures += 1
+            print(f"{scenario.name} FAILED")
+            traceback.print_exception(result)
+        else:
+            print(f"{scenario.name} PASSED")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    with asyncio.Runner(loop_factory=new_event_loop) as runner:
+        sys.exit(runner.run(main()))
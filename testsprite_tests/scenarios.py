@@ -0,0 +1,6 @@
+"""Registry of the TestSprite scenarios shared by run_all.py and test_scenarios.py."""
+from TC006_Advanced_Video_Editor___Real_time_Rendering_and_Timeline_Functionality import SCENARIO as TC006
+from TC007_3D_Avatar_Integration_and_Lip_sync_Animation import SCENARIO as TC007
+from TC012_Mobile_Responsiveness_and_Adaptive_Navigation import SCENARIO as TC012
+
+SCENARIOS = [TC006, TC007, TC012]
@@ -0,0 +1,169 @@
+import asyncio
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Awaitable, Callable
+
+from playwright import async_api
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional and does not support Windows
+    uvloop = None
+
+# Base URL of the application under test
+BASE_URL = "http://localhost:5000"
+
+# Chromium arguments for the single shared browser
+LAUNCH_ARGS = [
+    "--window-size=1280,720",         # Set the browser window size
+    "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
+    "--no-sandbox",                   # Chromium's sandbox is unavailable in most CI containers
+    "--ipc=host"                      # Use host-level IPC for better stability
+]
+
+# Sample presentation shipped at the repository root
+SAMPLE_PPTX = Path(__file__).resolve().parent.parent / "test-presentation.pptx"
+
+# Viewport of every test context
+VIEWPORT = {"width": 1280, "height": 720}
+
+# Optional Chromium profile directory (e.g. ".pw-cache"); when set, the test cases
+# share one persistent context so HTTP, V8 code and service-worker caches stay warm
+USER_DATA_DIR = os.environ.get("TESTSPRITE_USER_DATA_DIR")
+
+# Resource types the flows never inspect; aborting them keeps page loads short
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+
+# Playwright driver shared by every test case in this process
+_PW = None
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create a uvloop event loop when it is installed, else a default asyncio one."""
+    return uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+
+
+async def get_playwright() -> async_api.Playwright:
+    """Return the process-wide Playwright driver, starting it on first use."""
+    global _PW
+    if _PW is None:
+        _PW = await async_api.async_playwright().start()
+    return _PW
+
+
+async def stop_playwright() -> None:
+    """Stop the shared Playwright driver if it was started."""
+    global _PW
+    if _PW is not None:
+        await _PW.stop()
+        _PW = None
+
+
+async def launch_browser(pw: async_api.Playwright) -> async_api.Browser:
+    """Launch the headless Chromium instance shared by every test case."""
+    return await pw.chromium.launch(headless=True, args=LAUNCH_ARGS)
+
+
+async def block_unused_resources(route: async_api.Route) -> None:
+    """Abort requests for resource types the tests never look at."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def tap(locator: async_api.Locator, timeout: float = 5000) -> None:
+    """Click an exploratory target once it is visible, skipping the other actionability checks.
+
+    ``force=True`` drops the stable/enabled/receives-events polling a normal
+    click runs, so use it only for steps whose outcome no assertion depends on.
+    """
+    await locator.wait_for(state="visible", timeout=timeout)
+    await locator.click(force=True)
+
+
+async def upload_pptx(page: async_api.Page, upload_area: async_api.Locator, path: Path = SAMPLE_PPTX) -> None:
+    """Upload a presentation through the native file chooser the upload area opens."""
+    await upload_area.wait_for(state="visible", timeout=5000)
+    await upload_area.scroll_into_view_if_needed()
+    async with page.expect_file_chooser(timeout=10000) as fc_info:
+        await upload_area.click(timeout=5000)
+    chooser = await fc_info.value
+    await chooser.set_files(path)
+
+
+async def launch_persistent_context(
+    pw: async_api.Playwright, user_data_dir: str
+) -> async_api.BrowserContext:
+    """Launch Chromium on a reusable profile whose caches survive between runs."""
+    context = await pw.chromium.launch_persistent_context(
+        user_data_dir, headless=True, args=LAUNCH_ARGS, viewport=VIEWPORT
+    )
+    context.set_default_timeout(5000)
+    return context
+
+
+async def new_context(browser: async_api.Browser) -> async_api.BrowserContext:
+    """Create an isolated context (like an incognito window) for one test case."""
+    context = await browser.new_context(viewport=VIEWPORT)
+    context.set_default_timeout(5000)
+    return context
+
+
+async def new_page(
+    context: async_api.BrowserContext, block_resources: bool = True
+) -> async_api.Page:
+    """Open the page a test case drives.
+
+    Images, media and fonts are blocked unless ``block_resources`` is False.
+    Playwright disables the HTTP cache for any page with routing enabled, so
+    callers on a persistent profile pass False to keep its warm cache.
+    """
+    page = await context.new_page()
+    if block_resources:
+        await page.route("**/*", block_unused_resources)
+    return page
+
+
+# A step drives one part of a flow on the page, using the scenario's locators
+Step = Callable[[async_api.Page, dict[str, async_api.Locator]], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One TestSprite test case expressed as data: its locators and ordered steps."""
+
+    name: str
+    locators: Callable[[async_api.Page], dict[str, async_api.Locator]]
+    steps: list[Step]
+    load_images: bool = False
+
+
+def app_locators(page: async_api.Page) -> dict[str, async_api.Locator]:
+    """Return the locators shared by several scenarios."""
+    nav = page.get_by_role("navigation")
+    return {
+        "editor_btn": nav.get_by_role("button", name="Editor de Vídeo"),
+        "upload_btn": nav.get_by_role("button", name="Upload PPTX"),
+        "upload_area": page.locator('xpath=html/body/div/div/div/div[2]/main/div/div[2]/div[2]/div/div'),
+    }
+
+
+async def open_app(page: async_api.Page, loc: dict[str, async_api.Locator]) -> None:
+    """Navigate to the application and wait for the main page and its iframes."""
+    # Navigate to your target URL and wait until the main page reaches DOMContentLoaded
+    await page.goto(BASE_URL, wait_until="domcontentloaded", timeout=10000)
+
+    # Wait for all iframes to load as well, concurrently rather than one after another
+    await asyncio.gather(
+        *(frame.wait_for_load_state("domcontentloaded", timeout=3000) for frame in page.frames),
+        return_exceptions=True,
+    )
+
+
+async def run_steps(page: async_api.Page, scenario: Scenario) -> None:
+    """Resolve the scenario's locators once, then run its steps in order."""
+    loc = scenario.locators(page)
+    for step in scenario.steps:
+        await step(page, loc)
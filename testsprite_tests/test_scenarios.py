@@ -0,0 +1,19 @@
+import pytest
+
+from scenarios import SCENARIOS
+from support import run_steps
+
+
+@pytest.mark.parametrize(
+    "scenario",
+    [
+        pytest.param(
+            scenario,
+            id=scenario.name,
+            marks=[pytest.mark.load_images] if scenario.load_images else [],
+        )
+        for scenario in SCENARIOS
+    ],
+)
+async def test_scenario(scenario, page):
+    await run_steps(page, scenario)